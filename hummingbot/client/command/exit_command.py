@@ -3,6 +3,8 @@
 import asyncio
 from typing import TYPE_CHECKING
 
+from hummingbot.connector.gateway.gateway_base import GatewayBase
+from hummingbot.core.gateway.gateway_http_client import GatewayHttpClient
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 if TYPE_CHECKING:
@@ -30,6 +32,7 @@ class ExitCommand:
 
         if self._gateway_monitor is not None:
             self._gateway_monitor.stop()
+        await self._stop_gateway_connectors()
 
         self.notify("Winding down notifiers...")
         for notifier in self.notifiers:
@@ -37,3 +40,16 @@ class ExitCommand:
 
         self.app.exit()
         self.mqtt_stop()
+
+    async def _stop_gateway_connectors(self,  # type: HummingbotApplication
+                                       ):
+        """
+        Stops the networking of the Gateway connectors, then closes the HTTP session they share.
+        """
+        if self.strategy_task is not None:
+            # Let the clock unwind, it stops its iterators on exit
+            await asyncio.wait([self.strategy_task])
+        for market in self.markets.values():
+            if isinstance(market, GatewayBase):
+                await market.stop_network()
+        await GatewayHttpClient.close_http_client()
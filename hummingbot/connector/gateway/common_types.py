@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from decimal import Decimal
 from enum import Enum
 from typing import Any, Dict, Optional
 
@@ -32,6 +33,15 @@ def get_connector_type(connector_name: str) -> ConnectorType:
     return ConnectorType.SWAP
 
 
+@dataclass
+class QuoteSpec:
+    trading_pair: str
+    is_buy: bool
+    amount: Decimal
+    slippage_pct: Optional[Decimal] = None
+    pool_address: Optional[str] = None
+
+
 @dataclass
 class PlaceOrderResult:
     update_timestamp: float
@@ -27,6 +27,7 @@ if TYPE_CHECKING:
 
 s_logger = None
 s_decimal_0 = Decimal("0")
+s_decimal_price_quantum = Decimal("1e-15")
 
 
 class GatewayBase(ConnectorBase):
@@ -59,6 +60,7 @@ class GatewayBase(ConnectorBase):
     _order_tracker: ClientOrderTracker
     _native_currency: str
     _amount_quantum_dict: Dict[str, Decimal]
+    _order_size_quantum_dict: Dict[str, Decimal]
     _allowances: Dict[str, Decimal]
     _get_allowances_task: Optional[asyncio.Task]
 
@@ -101,6 +103,7 @@ class GatewayBase(ConnectorBase):
         self._native_currency = None
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self, lost_order_count_limit=10)
         self._amount_quantum_dict = {}
+        self._order_size_quantum_dict = {}
         self._allowances = {}
         self._get_allowances_task: Optional[asyncio.Task] = None
         safe_ensure_future(self.load_token_data())
@@ -233,16 +236,21 @@ class GatewayBase(ConnectorBase):
         tokens = await GatewayHttpClient.get_instance().get_tokens(self.chain, self.network)
         for t in tokens.get("tokens", []):
             self._amount_quantum_dict[t["symbol"]] = Decimal(str(10 ** -t["decimals"]))
+        self._order_size_quantum_dict.clear()
 
     def get_taker_order_type(self):
         return OrderType.LIMIT
 
     def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
-        return Decimal("1e-15")
+        return s_decimal_price_quantum
 
     def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
-        base, quote = trading_pair.split("-")
-        return max(self._amount_quantum_dict[base], self._amount_quantum_dict[quote])
+        quantum = self._order_size_quantum_dict.get(trading_pair)
+        if quantum is None:
+            base, quote = trading_pair.split("-")
+            quantum = max(self._amount_quantum_dict[base], self._amount_quantum_dict[quote])
+            self._order_size_quantum_dict[trading_pair] = quantum
+        return quantum
 
     async def get_chain_info(self):
         """
@@ -428,12 +436,12 @@ class GatewayBase(ConnectorBase):
         """
         Calls REST API to get status update for each in-flight AMM orders.
         """
+        # Orders still queued for submission have no transaction hash yet, they are polled once Gateway returns one
+        tracked_orders = [tracked_order for tracked_order in tracked_orders if tracked_order.exchange_order_id is not None]
         if len(tracked_orders) < 1:
             return
 
-        tx_hash_list: List[str] = await safe_gather(
-            *[tracked_order.get_exchange_order_id() for tracked_order in tracked_orders]
-        )
+        tx_hash_list: List[str] = [tracked_order.exchange_order_id for tracked_order in tracked_orders]
 
         self.logger().info(
             "Polling for order status updates of %d orders. Transaction hashes: %s",
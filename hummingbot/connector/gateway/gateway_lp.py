@@ -4,7 +4,7 @@ from typing import Any, Dict, Optional, Union
 
 from pydantic import BaseModel, Field
 
-from hummingbot.connector.gateway.common_types import ConnectorType, get_connector_type
+from hummingbot.connector.gateway.common_types import ConnectorType
 from hummingbot.connector.gateway.gateway_swap import GatewaySwap
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.utils import async_ttl_cache
@@ -105,7 +105,7 @@ class GatewayLp(GatewaySwap):
             )
 
             # Determine which model to use based on connector type
-            connector_type = get_connector_type(self.connector_name)
+            connector_type = self._connector_type
             if connector_type == ConnectorType.CLMM:
                 return CLMMPoolInfo(**resp) if resp else None
             elif connector_type == ConnectorType.AMM:
@@ -136,7 +136,7 @@ class GatewayLp(GatewaySwap):
         order_id: str = self.create_market_order_id(trade_type, trading_pair)
 
         # Check connector type and call appropriate function
-        connector_type = get_connector_type(self.connector_name)
+        connector_type = self._connector_type
         if connector_type == ConnectorType.CLMM:
             safe_ensure_future(self._clmm_open_position(trade_type, order_id, trading_pair, price, **request_args))
         elif connector_type == ConnectorType.AMM:
@@ -171,7 +171,7 @@ class GatewayLp(GatewaySwap):
         :return: Response from the gateway API
         """
         # Check connector type is CLMM
-        if get_connector_type(self.connector_name) != ConnectorType.CLMM:
+        if self._connector_type != ConnectorType.CLMM:
             raise ValueError(f"Connector {self.connector_name} is not of type CLMM.")
 
         # Split trading_pair to get base and quote tokens
@@ -245,7 +245,7 @@ class GatewayLp(GatewaySwap):
         :param slippage_pct: Maximum allowed slippage percentage
         """
         # Check connector type is AMM
-        if get_connector_type(self.connector_name) != ConnectorType.AMM:
+        if self._connector_type != ConnectorType.AMM:
             raise ValueError(f"Connector {self.connector_name} is not of type AMM.")
 
         # Split trading_pair to get base and quote tokens
@@ -303,7 +303,7 @@ class GatewayLp(GatewaySwap):
         :param percentage: Percentage of liquidity to remove (for AMM, defaults to 100%)
         :return: A newly created order id (internal).
         """
-        connector_type = get_connector_type(self.connector_name)
+        connector_type = self._connector_type
 
         # Verify we have a position address for CLMM positions
         if connector_type == ConnectorType.CLMM and position_address is None:
@@ -340,7 +340,7 @@ class GatewayLp(GatewaySwap):
         :param fail_silently: Whether to fail silently on error
         """
         # Check connector type is CLMM
-        if get_connector_type(self.connector_name) != ConnectorType.CLMM:
+        if self._connector_type != ConnectorType.CLMM:
             raise ValueError(f"Connector {self.connector_name} is not of type CLMM.")
 
         # Start tracking order
@@ -384,7 +384,7 @@ class GatewayLp(GatewaySwap):
         :param fail_silently: Whether to fail silently on error
         """
         # Check connector type is AMM
-        if get_connector_type(self.connector_name) != ConnectorType.AMM:
+        if self._connector_type != ConnectorType.AMM:
             raise ValueError(f"Connector {self.connector_name} is not of type AMM.")
 
         # Split trading_pair to get base and quote tokens
@@ -438,7 +438,7 @@ class GatewayLp(GatewaySwap):
         :return: Response from the gateway API
         """
         # Check connector type is AMM
-        if get_connector_type(self.connector_name) != ConnectorType.AMM:
+        if self._connector_type != ConnectorType.AMM:
             raise ValueError(f"Connector {self.connector_name} is not of type AMM.")
 
         # Split trading_pair to get base and quote tokens
@@ -488,7 +488,7 @@ class GatewayLp(GatewaySwap):
         :return: Response from the gateway API
         """
         # Check connector type is AMM
-        if get_connector_type(self.connector_name) != ConnectorType.AMM:
+        if self._connector_type != ConnectorType.AMM:
             raise ValueError(f"Connector {self.connector_name} is not of type AMM.")
 
         # Split trading_pair to get base and quote tokens
@@ -543,7 +543,7 @@ class GatewayLp(GatewaySwap):
 
             base_token, quote_token = tokens
 
-            connector_type = get_connector_type(self.connector_name)
+            connector_type = self._connector_type
             if connector_type == ConnectorType.CLMM:
                 if position_address is None:
                     raise ValueError("position_address is required for CLMM positions")
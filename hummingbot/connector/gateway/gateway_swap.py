@@ -1,12 +1,19 @@
 import asyncio
+import time
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from hummingbot.connector.gateway.common_types import ConnectorType, QuoteSpec, get_connector_type
 from hummingbot.connector.gateway.gateway_base import GatewayBase
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.gateway import check_transaction_exceptions
-from hummingbot.core.utils import async_ttl_cache
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+PRICE_RESPONSE_REQUIRED_ITEMS = ("price", "gasLimit", "gasPrice", "gasCost")
 
 
 class GatewaySwap(GatewayBase):
@@ -15,7 +22,67 @@ class GatewaySwap(GatewayBase):
     Maintains order tracking and wallet interactions in the base class.
     """
 
-    @async_ttl_cache(ttl=5, maxsize=10)
+    QUOTE_CACHE_TTL = 5.0
+    QUOTE_CACHE_MIN_TTL = 1.0
+    QUOTE_CACHE_MAX_TTL = 15.0
+    QUOTE_CACHE_TTL_GROWTH = 1.5
+    QUOTE_VOLATILITY_THRESHOLD = Decimal("0.001")
+    QUOTE_CACHE_MAXSIZE = 10
+    EXECUTE_SWAP_ROUTE = "execute-swap"
+    CHAINED_SWAP_ROUTE = "quote-and-execute-swap"
+
+    _quote_cache: "OrderedDict[Tuple, Tuple[float, Optional[Decimal], float]]"
+    _quote_ttl_bounds: Tuple[float, float]
+    _inflight_quotes: Dict[Tuple, asyncio.Task]
+    _pair_parts: Dict[str, Tuple[str, str]]
+    _connector_type: ConnectorType
+    _is_pool_addressable: bool
+    _order_semaphore: asyncio.Semaphore
+    _supports_chained_swap: bool
+
+    def __init__(self,
+                 client_config_map: "ClientConfigAdapter",
+                 connector_name: str,
+                 chain: str,
+                 network: str,
+                 address: str,
+                 trading_pairs: List[str] = [],
+                 trading_required: bool = True,
+                 max_concurrent_orders: int = 8,
+                 supports_chained_swap: bool = False
+                 ):
+        """
+        :param max_concurrent_orders: maximum number of swap orders submitted to Gateway at the same time
+        :param supports_chained_swap: whether Gateway serves the quote-and-execute-swap route, used to place orders
+        without a fresh quote in a single request
+        """
+        super().__init__(client_config_map=client_config_map,
+                         connector_name=connector_name,
+                         chain=chain,
+                         network=network,
+                         address=address,
+                         trading_pairs=trading_pairs,
+                         trading_required=trading_required)
+        self._quote_cache = OrderedDict()
+        self._quote_ttl_bounds = (self.QUOTE_CACHE_MIN_TTL, self.QUOTE_CACHE_MAX_TTL)
+        self._inflight_quotes = {}
+        self._pair_parts = {}
+        self._connector_type = get_connector_type(connector_name)
+        self._is_pool_addressable = self._connector_type in (ConnectorType.CLMM, ConnectorType.AMM)
+        self._order_semaphore = asyncio.Semaphore(max_concurrent_orders)
+        self._supports_chained_swap = supports_chained_swap
+
+    def _parse_pair(self, trading_pair: str) -> Tuple[str, str]:
+        """
+        Splits a trading pair into its base and quote tokens, memoizing the result per trading pair.
+        """
+        parts = self._pair_parts.get(trading_pair)
+        if parts is None:
+            base, quote = trading_pair.split("-")
+            parts = (base, quote)
+            self._pair_parts[trading_pair] = parts
+        return parts
+
     async def get_quote_price(
             self,
             trading_pair: str,
@@ -32,7 +99,76 @@ class GatewaySwap(GatewayBase):
         :param amount: The amount required (in base token unit)
         :return: The quote price.
         """
-        base, quote = trading_pair.split("-")
+        key = (trading_pair, is_buy, amount, slippage_pct, pool_address)
+        entry = self._quote_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._quote_cache.move_to_end(key)
+            return entry[1]
+
+        # Concurrent callers asking for the same quote share a single Gateway request.
+        task = self._inflight_quotes.get(key)
+        if task is None:
+            task = safe_ensure_future(
+                self._refresh_quote(key, trading_pair, is_buy, amount, slippage_pct, pool_address)
+            )
+            self._inflight_quotes[key] = task
+            task.add_done_callback(lambda _: self._inflight_quotes.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _refresh_quote(
+            self,
+            key: Tuple,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            slippage_pct: Optional[Decimal] = None,
+            pool_address: Optional[str] = None
+    ) -> Optional[Decimal]:
+        """
+        Fetches a quote from Gateway and stores it in the quote cache.
+        """
+        price = await self._fetch_quote_price(trading_pair, is_buy, amount, slippage_pct, pool_address)
+        self._store_quote(key, price)
+        return price
+
+    def _store_quote(self, key: Tuple, price: Optional[Decimal]):
+        """
+        Caches a quote with an adaptive TTL. The TTL drops to the lower bound when the price moved more than
+        QUOTE_VOLATILITY_THRESHOLD since the previous quote for the same key, and grows towards the upper bound while
+        consecutive quotes stay stable. Failed quotes are only kept for the lower bound and leave the TTL unchanged.
+        """
+        min_ttl, max_ttl = self._quote_ttl_bounds
+        previous = self._quote_cache.get(key)
+        ttl = self.QUOTE_CACHE_TTL if previous is None else previous[2]
+        if price is None:
+            expiry = time.monotonic() + min_ttl
+        else:
+            previous_price = None if previous is None else previous[1]
+            if previous_price is not None and previous_price != 0:
+                if abs(price - previous_price) / previous_price > self.QUOTE_VOLATILITY_THRESHOLD:
+                    ttl = min_ttl
+                else:
+                    ttl = ttl * self.QUOTE_CACHE_TTL_GROWTH
+            ttl = min(max(ttl, min_ttl), max_ttl)
+            expiry = time.monotonic() + ttl
+
+        self._quote_cache[key] = (expiry, price, ttl)
+        self._quote_cache.move_to_end(key)
+        while len(self._quote_cache) > self.QUOTE_CACHE_MAXSIZE:
+            self._quote_cache.popitem(last=False)
+
+    async def _fetch_quote_price(
+            self,
+            trading_pair: str,
+            is_buy: bool,
+            amount: Decimal,
+            slippage_pct: Optional[Decimal] = None,
+            pool_address: Optional[str] = None
+    ) -> Optional[Decimal]:
+        """
+        Requests a fresh quote from Gateway, bypassing the local quote cache.
+        """
+        base, quote = self._parse_pair(trading_pair)
         side: TradeType = TradeType.BUY if is_buy else TradeType.SELL
 
         # Pull the price from gateway.
@@ -45,7 +181,7 @@ class GatewaySwap(GatewayBase):
                 amount=amount,
                 side=side,
                 slippage_pct=slippage_pct,
-                pool_address=pool_address
+                pool_address=pool_address if self._is_pool_addressable else None
             )
             return self.parse_price_response(base, quote, amount, side, price_response=resp)
         except asyncio.CancelledError:
@@ -57,6 +193,26 @@ class GatewaySwap(GatewayBase):
                 app_warning_msg=str(e)
             )
 
+    async def get_quote_prices(self, specs: List[QuoteSpec]) -> List[Optional[Decimal]]:
+        """
+        Retrieves the quote prices for several markets concurrently, so that the Gateway round trips overlap instead of
+        being awaited one after the other.
+
+        :param specs: The quote requests, one per market/side/amount
+        :return: The quote prices in the same order as the specs, None where a quote could not be fetched.
+        """
+        results = await safe_gather(*[
+            self.get_quote_price(
+                trading_pair=spec.trading_pair,
+                is_buy=spec.is_buy,
+                amount=spec.amount,
+                slippage_pct=spec.slippage_pct,
+                pool_address=spec.pool_address
+            )
+            for spec in specs
+        ], return_exceptions=True)
+        return [None if isinstance(result, BaseException) else result for result in results]
+
     async def get_order_price(
             self,
             trading_pair: str,
@@ -86,16 +242,20 @@ class GatewaySwap(GatewayBase):
         :param price_response: Price response from Gateway.
         :param process_exception: Flag to trigger error on exception
         """
-        required_items = ["price", "gasLimit", "gasPrice", "gasCost"]
-        if any(item not in price_response.keys() for item in required_items):
-            if "info" in price_response.keys():
-                self.logger().info(f"Unable to get price. {price_response['info']}")
+        if any(item not in price_response for item in PRICE_RESPONSE_REQUIRED_ITEMS):
+            info = price_response.get("info")
+            if info is not None:
+                self.logger().info(f"Unable to get price. {info}")
             else:
-                self.logger().info(f"Missing data from price result. Incomplete return result for ({price_response.keys()})")
+                self.logger().info(f"Missing data from price result. Incomplete return result for ({list(price_response)})")
         else:
             gas_price_token: str = self._native_currency
             gas_cost: Decimal = Decimal(str(price_response["gasCost"]))
-            price: Decimal = Decimal(str(price_response["price"]))
+            raw_price = price_response["price"]
+            price: Decimal = (
+                raw_price if isinstance(raw_price, Decimal)
+                else Decimal(raw_price if isinstance(raw_price, str) else repr(raw_price))
+            )
             gas_limit: int = int(price_response["gasLimit"])
             # self.network_transaction_fee = TokenAmount(gas_price_token, gas_cost)
             if process_exception is True:
@@ -156,16 +316,30 @@ class GatewaySwap(GatewayBase):
         """
         side: TradeType = TradeType.BUY if is_buy else TradeType.SELL
         order_id: str = self.create_market_order_id(side, trading_pair)
-        safe_ensure_future(self._create_order(side, order_id, trading_pair, amount, price, **request_args))
+        route: str = self.EXECUTE_SWAP_ROUTE
+        if self._supports_chained_swap and not self._has_fresh_quote(trading_pair, is_buy, amount):
+            route = self.CHAINED_SWAP_ROUTE
+        safe_ensure_future(self._create_order(side, order_id, trading_pair, amount, price, route=route, **request_args))
         return order_id
 
+    def _has_fresh_quote(self, trading_pair: str, is_buy: bool, amount: Decimal) -> bool:
+        """
+        Checks whether a non-expired quote for the given market, side and amount is present in the quote cache.
+        """
+        now = time.monotonic()
+        return any(
+            key[0] == trading_pair and key[1] == is_buy and key[2] == amount and expiry > now and price is not None
+            for key, (expiry, price, _) in self._quote_cache.items()
+        )
+
     async def _create_order(
             self,
             trade_type: TradeType,
             order_id: str,
             trading_pair: str,
             amount: Decimal,
-            price: Decimal
+            price: Decimal,
+            route: str = EXECUTE_SWAP_ROUTE
     ):
         """
         Calls buy or sell API end point to place an order, starts tracking the order and triggers relevant order events.
@@ -174,27 +348,30 @@ class GatewaySwap(GatewayBase):
         :param trading_pair: The market to place order
         :param amount: The order amount (in base token value)
         :param price: The order price (TO-DO: add limit_price to Gateway execute-swap schema)
+        :param route: The Gateway swap route, execute-swap or quote-and-execute-swap
         """
 
         amount = self.quantize_order_amount(trading_pair, amount)
         price = self.quantize_order_price(trading_pair, price)
 
-        base, quote = trading_pair.split("-")
+        base, quote = self._parse_pair(trading_pair)
         self.start_tracking_order(order_id=order_id,
                                   trading_pair=trading_pair,
                                   trade_type=trade_type,
                                   price=price,
                                   amount=amount)
         try:
-            order_result: Dict[str, Any] = await self._get_gateway_instance().execute_swap(
-                self.network,
-                self.connector_name,
-                self.address,
-                base,
-                quote,
-                trade_type,
-                amount
-            )
+            async with self._order_semaphore:
+                order_result: Dict[str, Any] = await self._get_gateway_instance().execute_swap(
+                    self.network,
+                    self.connector_name,
+                    self.address,
+                    base,
+                    quote,
+                    trade_type,
+                    amount,
+                    route=route
+                )
             transaction_hash: Optional[str] = order_result.get("signature")
             if transaction_hash is not None and transaction_hash != "":
                 self.update_order_from_hash(order_id, trading_pair, transaction_hash, order_result)
@@ -6,6 +6,7 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import aiohttp
+import ujson
 from aiohttp import ContentTypeError
 
 from hummingbot.client.config.security import Security
@@ -16,6 +17,9 @@ from hummingbot.logger import HummingbotLogger
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+# Trade sides accepted by the swap routes, mapped to their request payload value
+_SIDE_NAMES: Dict[TradeType, str] = {TradeType.BUY: "BUY", TradeType.SELL: "SELL"}
+
 
 class GatewayError(Enum):
     """
@@ -47,6 +51,9 @@ class GatewayHttpClient:
     An HTTP client for making requests to the gateway API.
     """
 
+    CONNECTION_LIMIT_PER_HOST = 32
+    KEEPALIVE_TIMEOUT = 60.0
+
     _ghc_logger: Optional[HummingbotLogger] = None
     _shared_client: Optional[aiohttp.ClientSession] = None
     _base_url: str
@@ -87,10 +94,24 @@ class GatewayHttpClient:
             ssl_ctx.load_cert_chain(certfile=f"{cert_path}/client_cert.pem",
                                     keyfile=f"{cert_path}/client_key.pem",
                                     password=Security.secrets_manager.password.get_secret_value())
-            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx)
-            cls._shared_client = aiohttp.ClientSession(connector=conn)
+            conn = aiohttp.TCPConnector(ssl_context=ssl_ctx,
+                                        limit_per_host=cls.CONNECTION_LIMIT_PER_HOST,
+                                        keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+                                        enable_cleanup_closed=True)
+            cls._shared_client = aiohttp.ClientSession(connector=conn, json_serialize=ujson.dumps)
         return cls._shared_client
 
+    @classmethod
+    async def close_http_client(cls):
+        """
+        Closes the shared aiohttp.ClientSession and the pooled connections to the Gateway service.
+        Should only be called once the connectors using Gateway have stopped, otherwise their next request opens a new
+        session.
+        """
+        if cls._shared_client is not None:
+            await cls._shared_client.close()
+            cls._shared_client = None
+
     @classmethod
     def reload_certs(cls, client_config_map: "ClientConfigAdapter"):
         """
@@ -209,7 +230,7 @@ class GatewayHttpClient:
                 self.logger().network(f"The network call to {url} has timed out.")
             else:
                 try:
-                    parsed_response = await response.json()
+                    parsed_response = await response.json(loads=ujson.loads)
                 except ContentTypeError:
                     parsed_response = await response.text()
                 if response.status != 200 and \
@@ -444,7 +465,8 @@ class GatewayHttpClient:
             pool_address: Optional[str] = None,
             fail_silently: bool = False,
     ) -> Dict[str, Any]:
-        if side not in [TradeType.BUY, TradeType.SELL]:
+        side_name: Optional[str] = _SIDE_NAMES.get(side)
+        if side_name is None:
             raise ValueError("Only BUY and SELL prices are supported.")
 
         connector_type = get_connector_type(connector)
@@ -454,7 +476,7 @@ class GatewayHttpClient:
             "baseToken": base_asset,
             "quoteToken": quote_asset,
             "amount": float(amount),
-            "side": side.name
+            "side": side_name
         }
         if slippage_pct is not None:
             request_payload["slippagePct"] = float(slippage_pct)
@@ -515,8 +537,14 @@ class GatewayHttpClient:
         pool_address: Optional[str] = None,
         # limit_price: Optional[Decimal] = None,
         nonce: Optional[int] = None,
+        route: str = "execute-swap",
     ) -> Dict[str, Any]:
-        if side not in [TradeType.BUY, TradeType.SELL]:
+        """
+        :param route: the connector route to post the swap to, "quote-and-execute-swap" makes Gateway quote and execute
+        the swap in a single request
+        """
+        side_name: Optional[str] = _SIDE_NAMES.get(side)
+        if side_name is None:
             raise ValueError("Only BUY and SELL prices are supported.")
 
         connector_type = get_connector_type(connector)
@@ -527,7 +555,7 @@ class GatewayHttpClient:
             "baseToken": base_asset,
             "quoteToken": quote_asset,
             "amount": float(amount),
-            "side": side.name,
+            "side": side_name,
         }
         if slippage_pct is not None:
             request_payload["slippagePct"] = float(slippage_pct)
@@ -539,7 +567,7 @@ class GatewayHttpClient:
             request_payload["poolAddress"] = pool_address
         return await self.api_request(
             "post",
-            f"connectors/{connector}/execute-swap",
+            f"connectors/{connector}/{route}",
             request_payload
         )
 
@@ -0,0 +1,281 @@
+import asyncio
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from typing import Any, Dict
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.gateway.common_types import QuoteSpec
+from hummingbot.connector.gateway.gateway_swap import GatewaySwap
+from hummingbot.core.data_type.common import TradeType
+
+
+class GatewaySwapTest(IsolatedAsyncioWrapperTestCase):
+    base_asset = "COIN"
+    quote_asset = "ALPHA"
+    trading_pair = f"{base_asset}-{quote_asset}"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.gateway = AsyncMock()
+        self.gateway.get_tokens.return_value = {
+            "tokens": [
+                {"symbol": self.base_asset, "decimals": 6},
+                {"symbol": self.quote_asset, "decimals": 6},
+            ]
+        }
+        self.gateway.quote_swap.return_value = self.quote_response("1")
+
+        get_instance_patch = patch(
+            "hummingbot.connector.gateway.gateway_base.GatewayHttpClient.get_instance",
+            return_value=self.gateway
+        )
+        get_instance_patch.start()
+        self.addCleanup(get_instance_patch.stop)
+        exceptions_patch = patch(
+            "hummingbot.connector.gateway.gateway_swap.check_transaction_exceptions",
+            return_value=[]
+        )
+        exceptions_patch.start()
+        self.addCleanup(exceptions_patch.stop)
+
+        self.clock = MagicMock()
+        self.clock.monotonic.return_value = 1000.0
+        time_patch = patch("hummingbot.connector.gateway.gateway_swap.time", self.clock)
+        time_patch.start()
+        self.addCleanup(time_patch.stop)
+
+        self.connector = GatewaySwap(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            connector_name="uniswap/amm",
+            chain="ethereum",
+            network="mainnet",
+            address="0xWallet",
+            trading_pairs=[self.trading_pair],
+        )
+        self.connector._set_current_timestamp(1640000000.0)
+        # Let the token data load scheduled by the constructor complete
+        await asyncio.sleep(0)
+
+    @staticmethod
+    def quote_response(price: str) -> Dict[str, Any]:
+        return {
+            "price": price,
+            "gasLimit": 100000,
+            "gasPrice": 10,
+            "gasCost": 0.001,
+        }
+
+    def advance_clock(self, seconds: float):
+        self.clock.monotonic.return_value += seconds
+
+    async def test_get_quote_price_served_from_cache_until_expiry(self):
+        price = await self.connector.get_quote_price(self.trading_pair, True, Decimal("1"))
+        self.assertEqual(Decimal("1"), price)
+
+        self.gateway.quote_swap.return_value = self.quote_response("2")
+        self.advance_clock(self.connector.QUOTE_CACHE_TTL - 1)
+        price = await self.connector.get_quote_price(self.trading_pair, True, Decimal("1"))
+        self.assertEqual(Decimal("1"), price)
+        self.assertEqual(1, self.gateway.quote_swap.call_count)
+
+        self.advance_clock(1)
+        price = await self.connector.get_quote_price(self.trading_pair, True, Decimal("1"))
+        self.assertEqual(Decimal("2"), price)
+        self.assertEqual(2, self.gateway.quote_swap.call_count)
+
+    async def test_get_quote_price_cache_keyed_by_arguments(self):
+        await self.connector.get_quote_price(self.trading_pair, True, Decimal("1"))
+        await self.connector.get_quote_price(self.trading_pair, False, Decimal("1"))
+        await self.connector.get_quote_price(self.trading_pair, True, Decimal("2"))
+
+        self.assertEqual(3, self.gateway.quote_swap.call_count)
+
+    async def test_get_quote_price_evicts_least_recently_used(self):
+        maxsize = self.connector.QUOTE_CACHE_MAXSIZE
+        for amount in range(maxsize):
+            await self.connector.get_quote_price(self.trading_pair, True, Decimal(amount))
+        # Touch the oldest entry so that the second oldest becomes the eviction candidate
+        await self.connector.get_quote_price(self.trading_pair, True, Decimal(0))
+        await self.connector.get_quote_price(self.trading_pair, True, Decimal(maxsize))
+        self.assertEqual(maxsize + 1, self.gateway.quote_swap.call_count)
+
+        await self.connector.get_quote_price(self.trading_pair, True, Decimal(0))
+        self.assertEqual(maxsize + 1, self.gateway.quote_swap.call_count)
+
+        await self.connector.get_quote_price(self.trading_pair, True, Decimal(1))
+        self.assertEqual(maxsize + 2, self.gateway.quote_swap.call_count)
+
+    def block_quote_swap(self) -> asyncio.Event:
+        release = asyncio.Event()
+
+        async def quote_swap(**kwargs):
+            await release.wait()
+            return self.quote_response("1")
+
+        self.gateway.quote_swap.side_effect = quote_swap
+        return release
+
+    async def test_get_quote_price_concurrent_callers_share_request(self):
+        release = self.block_quote_swap()
+        first = asyncio.create_task(self.connector.get_quote_price(self.trading_pair, True, Decimal("1")))
+        second = asyncio.create_task(self.connector.get_quote_price(self.trading_pair, True, Decimal("1")))
+        await asyncio.sleep(0.01)
+
+        release.set()
+        results = await asyncio.gather(first, second)
+
+        self.assertEqual([Decimal("1"), Decimal("1")], results)
+        self.assertEqual(1, self.gateway.quote_swap.call_count)
+        self.assertEqual({}, self.connector._inflight_quotes)
+
+    async def test_get_quote_price_cancelled_caller_does_not_cancel_shared_request(self):
+        release = self.block_quote_swap()
+        first = asyncio.create_task(self.connector.get_quote_price(self.trading_pair, True, Decimal("1")))
+        second = asyncio.create_task(self.connector.get_quote_price(self.trading_pair, True, Decimal("1")))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+
+        self.assertEqual(Decimal("1"), await second)
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+        self.assertEqual(1, self.gateway.quote_swap.call_count)
+        # The shared request completed and populated the cache
+        self.assertEqual(Decimal("1"), await self.connector.get_quote_price(self.trading_pair, True, Decimal("1")))
+        self.assertEqual(1, self.gateway.quote_swap.call_count)
+
+    async def test_place_order_uses_execute_swap_when_chained_swap_not_supported(self):
+        with patch.object(self.connector, "_create_order", new_callable=AsyncMock) as create_order_mock:
+            self.connector.place_order(True, self.trading_pair, Decimal("1"), Decimal("1"))
+
+        self.assertEqual(GatewaySwap.EXECUTE_SWAP_ROUTE, create_order_mock.call_args.kwargs["route"])
+
+    async def test_place_order_routes_through_chained_swap_without_fresh_quote(self):
+        self.connector._supports_chained_swap = True
+        await self.connector.get_quote_price(self.trading_pair, True, Decimal("1"))
+
+        with patch.object(self.connector, "_create_order", new_callable=AsyncMock) as create_order_mock:
+            # A fresh quote for the same market, side and amount was fetched beforehand
+            self.connector.place_order(True, self.trading_pair, Decimal("1"), Decimal("1"))
+            self.assertEqual(GatewaySwap.EXECUTE_SWAP_ROUTE, create_order_mock.call_args.kwargs["route"])
+
+            # Quotes for a different amount or side do not count
+            self.connector.place_order(True, self.trading_pair, Decimal("2"), Decimal("1"))
+            self.assertEqual(GatewaySwap.CHAINED_SWAP_ROUTE, create_order_mock.call_args.kwargs["route"])
+            self.connector.place_order(False, self.trading_pair, Decimal("1"), Decimal("1"))
+            self.assertEqual(GatewaySwap.CHAINED_SWAP_ROUTE, create_order_mock.call_args.kwargs["route"])
+
+            # Expired quotes do not count either
+            self.advance_clock(self.connector.QUOTE_CACHE_MAX_TTL)
+            self.connector.place_order(True, self.trading_pair, Decimal("1"), Decimal("1"))
+            self.assertEqual(GatewaySwap.CHAINED_SWAP_ROUTE, create_order_mock.call_args.kwargs["route"])
+
+    async def test_create_order_posts_to_given_route(self):
+        self.gateway.execute_swap.return_value = {"signature": "0xHash", "nonce": 1}
+
+        await self.connector._create_order(
+            TradeType.BUY, "buy-1", self.trading_pair, Decimal("1"), Decimal("1"), route=GatewaySwap.CHAINED_SWAP_ROUTE
+        )
+        # Let the order tracker process the order update
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(GatewaySwap.CHAINED_SWAP_ROUTE, self.gateway.execute_swap.call_args.kwargs["route"])
+        self.assertEqual("0xHash", self.connector.in_flight_orders["buy-1"].exchange_order_id)
+
+    async def test_get_quote_prices_keeps_spec_order(self):
+        async def quote_swap(**kwargs):
+            return self.quote_response("1" if kwargs["base_asset"] == self.base_asset else "2")
+
+        self.gateway.quote_swap.side_effect = quote_swap
+
+        prices = await self.connector.get_quote_prices([
+            QuoteSpec(trading_pair=self.trading_pair, is_buy=True, amount=Decimal("1")),
+            QuoteSpec(trading_pair=f"{self.quote_asset}-{self.base_asset}", is_buy=True, amount=Decimal("1")),
+            QuoteSpec(trading_pair=self.trading_pair, is_buy=False, amount=Decimal("1")),
+        ])
+
+        self.assertEqual([Decimal("1"), Decimal("2"), Decimal("1")], prices)
+
+    async def test_get_quote_prices_maps_failures_to_none(self):
+        specs = [QuoteSpec(trading_pair=self.trading_pair, is_buy=True, amount=Decimal(amount)) for amount in range(4)]
+
+        with patch.object(self.connector, "get_quote_price", new_callable=AsyncMock) as get_quote_price_mock:
+            get_quote_price_mock.side_effect = [Decimal("1"), Exception("boom"), asyncio.CancelledError(), None]
+            prices = await self.connector.get_quote_prices(specs)
+
+        self.assertEqual([Decimal("1"), None, None, None], prices)
+
+    async def refresh_quote(self, price: str) -> float:
+        """
+        Expires the cached quote, fetches it again at the given price and returns the TTL it was cached with.
+        """
+        self.gateway.quote_swap.return_value = self.quote_response(price)
+        self.advance_clock(self.connector.QUOTE_CACHE_MAX_TTL)
+        await self.connector.get_quote_price(self.trading_pair, True, Decimal("1"))
+        return self.connector._quote_cache[(self.trading_pair, True, Decimal("1"), None, None)][2]
+
+    async def test_quote_ttl_grows_up_to_cap_while_price_is_stable(self):
+        self.assertEqual(self.connector.QUOTE_CACHE_TTL, await self.refresh_quote("1"))
+        self.assertEqual(7.5, await self.refresh_quote("1"))
+        # A move within the volatility threshold still counts as stable
+        self.assertEqual(11.25, await self.refresh_quote("1.0005"))
+        self.assertEqual(15.0, await self.refresh_quote("1.0005"))
+        self.assertEqual(15.0, await self.refresh_quote("1.0005"))
+
+    async def test_quote_ttl_drops_to_lower_bound_on_price_move(self):
+        await self.refresh_quote("1")
+        await self.refresh_quote("1")
+
+        self.assertEqual(1.0, await self.refresh_quote("1.002"))
+        self.assertEqual(1.5, await self.refresh_quote("1.002"))
+
+    async def test_failed_quote_cached_for_lower_bound_without_changing_ttl(self):
+        for _ in range(5):
+            await self.refresh_quote("1")
+        self.assertEqual(15.0, await self.refresh_quote("1"))
+
+        self.gateway.quote_swap.side_effect = Exception("Gateway error")
+        self.advance_clock(self.connector.QUOTE_CACHE_MAX_TTL)
+        self.assertIsNone(await self.connector.get_quote_price(self.trading_pair, True, Decimal("1")))
+        self.assertEqual(15.0, self.connector._quote_cache[(self.trading_pair, True, Decimal("1"), None, None)][2])
+
+        self.gateway.quote_swap.side_effect = None
+        self.gateway.quote_swap.return_value = self.quote_response("1")
+        self.advance_clock(self.connector.QUOTE_CACHE_MIN_TTL)
+        self.assertEqual(Decimal("1"), await self.connector.get_quote_price(self.trading_pair, True, Decimal("1")))
+        self.assertEqual(8, self.gateway.quote_swap.call_count)
+        # The TTL growth resumes from where it was before the failure
+        self.assertEqual(15.0, self.connector._quote_cache[(self.trading_pair, True, Decimal("1"), None, None)][2])
+
+    async def test_orders_queued_beyond_concurrency_limit_do_not_block_status_polling(self):
+        release = asyncio.Event()
+
+        async def execute_swap(*args, **kwargs):
+            await release.wait()
+            return {"signature": f"0xHash{self.gateway.execute_swap.call_count}", "nonce": 1}
+
+        self.gateway.execute_swap.side_effect = execute_swap
+        self.gateway.get_transaction_status.return_value = {"signature": "0xHash", "txStatus": 0}
+
+        order_ids = [self.connector.place_order(True, self.trading_pair, Decimal("1"), Decimal("1")) for _ in range(10)]
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(8, self.gateway.execute_swap.call_count)
+        self.assertEqual(10, len(self.connector.gateway_orders))
+
+        # None of the orders has a transaction hash yet, polling must return without waiting for one
+        await asyncio.wait_for(self.connector.update_order_status(self.connector.gateway_orders), timeout=1)
+        self.gateway.get_transaction_status.assert_not_called()
+
+        release.set()
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(10, self.gateway.execute_swap.call_count)
+        for order_id in order_ids:
+            self.assertIsNotNone(self.connector.in_flight_orders[order_id].exchange_order_id)
+        await asyncio.wait_for(self.connector.update_order_status(self.connector.gateway_orders), timeout=1)
+        self.assertEqual(10, self.gateway.get_transaction_status.call_count)